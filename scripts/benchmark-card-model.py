@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Script para medir a memória usada pelas cartas como dicts vs. modelo compacto
+(card_model.Card) em um corpus multi-idioma de ~100k cartas.
+"""
+
+import gc
+import tracemalloc
+from pathlib import Path
+from typing import List
+
+import json_codec
+from card_model import SetRef, cards_from_json, cards_to_json
+from synthetic_corpus import synthetic_corpus
+
+
+def measure(label: str, build) -> int:
+    """Mede a memória retida pelo objeto retornado por `build`."""
+    gc.collect()
+    tracemalloc.start()
+    obj = build()
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:>22}: {current / 1024 / 1024:8.1f} MB")
+    del obj
+    return current
+
+
+def main():
+    """Função principal."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Mede a memória do modelo compacto de cartas")
+    parser.add_argument(
+        '--corpus',
+        nargs='*',
+        help='Arquivos pokemon_cards_detailed.json (um por idioma); padrão: corpus sintético'
+    )
+    parser.add_argument(
+        '--cards',
+        type=int,
+        default=100_000,
+        help='Tamanho do corpus sintético (padrão: 100000)'
+    )
+
+    args = parser.parse_args()
+
+    if args.corpus:
+        raw: List[str] = [Path(p).read_text(encoding='utf-8') for p in args.corpus]
+    else:
+        raw = [synthetic_corpus(args.cards)]
+
+    def load_dicts():
+        return [card for text in raw for card in json_codec.loads(text)]
+
+    def load_models():
+        SetRef._cache.clear()
+        return [card for text in raw for card in cards_from_json(json_codec.loads(text))]
+
+    dicts = load_dicts()
+    print(f"🃏 Cartas no corpus: {len(dicts)}")
+    if cards_to_json(cards_from_json(dicts)) != dicts:
+        print("❌ Conversão de ida e volta não preservou todas as cartas!")
+        exit(1)
+    del dicts
+
+    dict_bytes = measure("dicts", load_dicts)
+    model_bytes = measure("card_model.Card", load_models)
+
+    print(f"📉 Economia: {(1 - model_bytes / dict_bytes) * 100:.1f}%")
+
+
+if __name__ == "__main__":
+    main()
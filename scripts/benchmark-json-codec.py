@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Script para medir a vazão de leitura/escrita da camada json_codec
+(stdlib vs. orjson) nos arquivos reais de dados ou em um corpus sintético.
+"""
+
+import time
+from pathlib import Path
+
+import json_codec
+from synthetic_corpus import synthetic_corpus
+
+
+def throughput(label: str, size: int, fn, repeat: int) -> float:
+    """Executa `fn` `repeat` vezes e imprime a vazão em MB/s."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    elapsed = (time.perf_counter() - start) / repeat
+    rate = size / elapsed / 1024 / 1024
+    print(f"   {label:<16} {elapsed * 1000:9.1f} ms  {rate:8.1f} MB/s")
+    return rate
+
+
+def benchmark_bytes(label: str, raw: bytes, backends, repeat: int):
+    """Mede load/dump (pretty e compacto) de um JSON para cada backend."""
+    size = len(raw)
+    print(f"\n📁 {label} ({size / 1024 / 1024:.1f} MB)")
+
+    for backend in backends:
+        json_codec.BACKEND = backend
+        data = json_codec.loads(raw)
+        print(f"🔧 {backend}:")
+        throughput("load", size, lambda: json_codec.loads(raw), repeat)
+        throughput("dump pretty", size, lambda: json_codec.dumps(data, as_bytes=True), repeat)
+        throughput("dump compacto", size, lambda: json_codec.dumps(data, pretty=False, as_bytes=True), repeat)
+
+
+def main():
+    """Função principal."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Mede a vazão de load/dump do json_codec")
+    parser.add_argument(
+        'files',
+        nargs='*',
+        default=['assets/data/pokemon_list.json', 'assets/data/pokemon_cards_detailed.json'],
+        help='Arquivos JSON a medir (padrão: pokemon_list.json e pokemon_cards_detailed.json)'
+    )
+    parser.add_argument(
+        '--repeat',
+        type=int,
+        default=5,
+        help='Repetições por medida (padrão: 5)'
+    )
+    parser.add_argument(
+        '--synthetic',
+        type=int,
+        metavar='CARTAS',
+        help='Mede também um corpus sintético de cartas detalhadas com esse tamanho'
+    )
+
+    args = parser.parse_args()
+
+    backends = ['json']
+    if json_codec.orjson is not None:
+        backends.append('orjson')
+    else:
+        print("⚠️  orjson não instalado, medindo apenas a stdlib (pip install orjson)")
+
+    for file in args.files:
+        path = Path(file)
+        if not path.exists():
+            print(f"\n❌ Arquivo não encontrado: {path}")
+            continue
+        benchmark_bytes(str(path), path.read_bytes(), backends, args.repeat)
+
+    if args.synthetic:
+        raw = synthetic_corpus(args.synthetic).encode('utf-8')
+        benchmark_bytes(f"corpus sintético ({args.synthetic} cartas)", raw, backends, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Script para pré-calcular as contagens (facets) usadas nas telas de navegação.
+Gera src/data/aggregates.json com cartas por set, série, raridade, tipo,
+categoria e ilustrador, além da completude de cada set.
+"""
+
+import hashlib
+from collections import Counter
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import json_codec
+from card_model import Card, cards_from_json
+
+# Campos agregados por carta (nome do facet -> atributo do Card)
+FACET_FIELDS = {
+    'rarity': 'rarity',
+    'category': 'category',
+    'illustrator': 'illustrator',
+}
+
+AGGREGATES_VERSION = 1
+
+
+class AggregatesBuilder:
+    def __init__(self, data_dir: str = "assets/data", output_dir: str = "src/data"):
+        self.data_dir = Path(data_dir)
+        self.output_dir = Path(output_dir)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+
+        # Arquivos
+        self.sets_file = self.data_dir / "pokemon_sets.json"
+        self.detailed_cards_file = self.data_dir / "pokemon_cards_detailed.json"
+        self.aggregates_file = self.output_dir / "aggregates.json"
+        # Cache do pipeline (sinais de mudança por set); não vai para o app
+        self.cache_file = self.data_dir / "aggregates_cache.json"
+
+    def load_sets(self) -> Dict[str, Dict]:
+        """Carrega os sets indexados por ID."""
+        if not self.sets_file.exists():
+            raise FileNotFoundError(f"Arquivo {self.sets_file} não encontrado!")
+
+        return {item['id']: item for item in json_codec.load(self.sets_file)}
+
+    def load_cards(self) -> List[Card]:
+        """Carrega as cartas detalhadas no modelo compacto."""
+        if not self.detailed_cards_file.exists():
+            raise FileNotFoundError(f"Arquivo {self.detailed_cards_file} não encontrado!")
+
+        return cards_from_json(json_codec.load(self.detailed_cards_file))
+
+    def load_cache(self) -> Dict[str, Dict]:
+        """Carrega o cache da execução anterior para reaproveitar sets sem mudança."""
+        if not self.cache_file.exists():
+            return {}
+
+        try:
+            data = json_codec.load(self.cache_file)
+        except json_codec.JSONDecodeError:
+            print("⚠️  aggregates_cache.json corrompido, recalculando tudo...")
+            return {}
+
+        if data.get('version') != AGGREGATES_VERSION:
+            return {}
+        return data.get('sets', {})
+
+    @staticmethod
+    def change_signal(cards: List[Card]) -> Optional[str]:
+        """Sinal barato de mudança de um set: IDs e campo `updated` das cartas.
+
+        Retorna None quando alguma carta não tem `updated`; nesse caso o set
+        é sempre recalculado.
+        """
+        entries = []
+        for card in cards:
+            if not card.updated:
+                return None
+            entries.append(f"{card.id}\x00{card.updated}")
+
+        entries.sort()
+        return hashlib.sha1('\n'.join(entries).encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def compute_set_facets(cards: List[Card]) -> Dict[str, Dict[str, int]]:
+        """Conta as cartas de um set por raridade, categoria, ilustrador e tipo."""
+        counters = {facet: Counter() for facet in FACET_FIELDS}
+        types = Counter()
+
+        for card in cards:
+            for facet, field in FACET_FIELDS.items():
+                counters[facet][getattr(card, field) or 'Unknown'] += 1
+            # Uma carta com dois tipos conta para ambos
+            types.update(set(card.types or []))
+
+        facets = {facet: dict(counter) for facet, counter in counters.items()}
+        facets['types'] = dict(types)
+        return facets
+
+    def build(self, full: bool = False) -> Tuple[Dict, Dict]:
+        """Calcula os agregados, recalculando apenas os sets alterados.
+
+        Retorna (agregados para o app, cache para a próxima execução).
+        """
+        print("📊 Calculando agregados das cartas...")
+
+        sets = self.load_sets()
+        cards = self.load_cards()
+        previous = {} if full else self.load_cache()
+
+        # Agrupa as cartas por set em uma única passada
+        cards_by_set: Dict[str, List[Card]] = {}
+        for card in cards:
+            cards_by_set.setdefault(card.set_id, []).append(card)
+
+        cache_entries = {}
+        recomputed = 0
+
+        for set_id, set_cards in cards_by_set.items():
+            signal = self.change_signal(set_cards)
+            cached = previous.get(set_id)
+
+            if signal and cached and cached.get('signal') == signal:
+                cache_entries[set_id] = cached
+            else:
+                cache_entries[set_id] = {
+                    'signal': signal,
+                    'cards': len(set_cards),
+                    'facets': self.compute_set_facets(set_cards),
+                }
+                recomputed += 1
+
+        print(f"🔄 Sets recalculados: {recomputed}/{len(cards_by_set)}")
+
+        set_entries = {}
+        for set_id in set(cache_entries) | set(sets):
+            # Sets sem nenhuma carta baixada também aparecem, com completude zero
+            cached = cache_entries.get(set_id) or {'cards': 0, 'facets': self.compute_set_facets([])}
+            # Série e total vêm sempre do arquivo de sets, que pode mudar sem mudar as cartas
+            set_info = sets.get(set_id, {})
+            total = set_info.get('totalCards') or 0
+            set_entries[set_id] = {
+                'cards': cached['cards'],
+                'facets': cached['facets'],
+                'series': set_info.get('series') or 'Unknown',
+                'total': total,
+                'completeness': round(min(cached['cards'] / total, 1.0), 4) if total else None,
+            }
+
+        cache = {
+            'version': AGGREGATES_VERSION,
+            'processedAt': datetime.now(timezone.utc).isoformat(),
+            'sets': cache_entries,
+        }
+        return self.merge(set_entries), cache
+
+    @staticmethod
+    def merge(set_entries: Dict[str, Dict]) -> Dict:
+        """Soma os facets de cada set para obter os totais globais."""
+        totals = {facet: Counter() for facet in list(FACET_FIELDS) + ['types']}
+        by_series = Counter()
+
+        for entry in set_entries.values():
+            by_series[entry['series']] += entry['cards']
+            for facet, counts in entry['facets'].items():
+                totals[facet].update(counts)
+
+        return {
+            'version': AGGREGATES_VERSION,
+            'cards': sum(entry['cards'] for entry in set_entries.values()),
+            'bySet': {set_id: entry['cards'] for set_id, entry in set_entries.items()},
+            'bySeries': dict(by_series),
+            'byRarity': dict(totals['rarity']),
+            'byType': dict(totals['types']),
+            'byCategory': dict(totals['category']),
+            'byIllustrator': dict(totals['illustrator']),
+            'sets': set_entries,
+        }
+
+    def save(self, aggregates: Dict, cache: Dict):
+        """Salva o artefato compacto do app e o cache do pipeline."""
+        json_codec.dump(aggregates, self.aggregates_file, pretty=False)
+        json_codec.dump(cache, self.cache_file, pretty=False)
+
+        print(f"💾 Agregados salvos em: {self.aggregates_file}")
+        print(f"📊 Cartas: {aggregates['cards']} | Sets: {len(aggregates['bySet'])} | Séries: {len(aggregates['bySeries'])}")
+
+
+def main():
+    """Função principal."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Pré-calcula contagens para as telas de navegação")
+    parser.add_argument(
+        '--full',
+        action='store_true',
+        help='Ignora o cache da execução anterior e recalcula todos os sets'
+    )
+    parser.add_argument(
+        '--data-dir',
+        default='assets/data',
+        help='Diretório dos dados brutos (padrão: assets/data)'
+    )
+    parser.add_argument(
+        '--output-dir',
+        default='src/data',
+        help='Diretório de saída (padrão: src/data)'
+    )
+
+    args = parser.parse_args()
+
+    try:
+        builder = AggregatesBuilder(args.data_dir, args.output_dir)
+        builder.save(*builder.build(full=args.full))
+    except FileNotFoundError as e:
+        print(f"❌ Erro: {e}")
+        exit(1)
+
+
+if __name__ == "__main__":
+    main()
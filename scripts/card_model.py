@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+"""
+Modelo compacto das cartas Pokémon TCG usado pelos scripts Python.
+Usa __slots__ e strings internadas para reduzir a memória por carta,
+com conversão direta de/para o JSON da API tcgdex.
+
+A conversão é sem perdas: chaves não modeladas e chaves com null explícito
+ficam em `extra` e voltam iguais em to_dict(). Valores com formato inesperado
+(ex.: `cost` como string, `cardCount` como número) são mantidos como vieram.
+"""
+
+import sys
+from typing import Any, Dict, List, Optional, Tuple
+
+
+def _intern(value):
+    """Interna strings de campos enumerados (raridade, tipos, estágio...)."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def _intern_list(values):
+    return [_intern(v) for v in values] if isinstance(values, list) else values
+
+
+def _copy(value):
+    """Copia listas e dicts; outros valores voltam sem alteração."""
+    if isinstance(value, list):
+        return list(value)
+    if isinstance(value, dict):
+        return dict(value)
+    return value
+
+
+def _from_list(cls, values):
+    """Converte uma lista de dicts em objetos de `cls`; outros formatos ficam como vieram."""
+    if isinstance(values, list) and all(isinstance(v, dict) for v in values):
+        return [cls.from_dict(v) for v in values]
+    return values
+
+
+def _to_list(values):
+    if isinstance(values, list):
+        return [v.to_dict() if hasattr(v, 'to_dict') else v for v in values]
+    return values
+
+
+def _split_nulls(data: Dict) -> Tuple[Dict, Dict]:
+    """Separa as chaves com null explícito, que são preservadas em `extra`."""
+    values = {k: v for k, v in data.items() if v is not None}
+    nulls = {k: None for k, v in data.items() if v is None}
+    return values, nulls
+
+
+def _extra(remaining: Dict, nulls: Dict) -> Optional[Dict]:
+    return {**remaining, **nulls} or None
+
+
+def _base_dict(extra: Optional[Dict]) -> Dict:
+    """Ponto de partida do to_dict(); campos modelados sobrescrevem `extra`."""
+    return dict(extra) if extra else {}
+
+
+def set_id_from_card_id(card_id: str) -> str:
+    """Deduz o ID do set a partir do ID da carta (bw1-1 → bw1, P-A-001 → P-A)."""
+    return card_id.rsplit('-', 1)[0]
+
+
+def card_set_id(card: Dict) -> str:
+    """ID do set de uma carta em JSON (detalhada ou da lista breve)."""
+    card_set = card.get('set')
+    if isinstance(card_set, dict) and card_set.get('id'):
+        return card_set['id']
+    if isinstance(card_set, str) and card_set:
+        return card_set
+    return set_id_from_card_id(card['id'])
+
+
+class Attack:
+    __slots__ = ('name', 'cost', 'damage', 'effect', 'extra')
+
+    def __init__(self, name=None, cost=None, damage=None, effect=None, extra=None):
+        self.name = name
+        self.cost = cost
+        self.damage = damage
+        self.effect = effect
+        self.extra = extra
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'Attack':
+        data, nulls = _split_nulls(data)
+        return cls(
+            name=data.pop('name', None),
+            cost=_intern_list(data.pop('cost', None)),
+            damage=data.pop('damage', None),
+            effect=data.pop('effect', None),
+            extra=_extra(data, nulls),
+        )
+
+    def to_dict(self) -> Dict:
+        result = _base_dict(self.extra)
+        if self.cost is not None:
+            result['cost'] = _copy(self.cost)
+        if self.name is not None:
+            result['name'] = self.name
+        if self.effect is not None:
+            result['effect'] = self.effect
+        if self.damage is not None:
+            result['damage'] = self.damage
+        return result
+
+
+class Weakness:
+    __slots__ = ('type', 'value', 'extra')
+
+    def __init__(self, type=None, value=None, extra=None):
+        self.type = type
+        self.value = value
+        self.extra = extra
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'Weakness':
+        data, nulls = _split_nulls(data)
+        return cls(
+            type=_intern(data.pop('type', None)),
+            value=_intern(data.pop('value', None)),
+            extra=_extra(data, nulls),
+        )
+
+    def to_dict(self) -> Dict:
+        result = _base_dict(self.extra)
+        if self.type is not None:
+            result['type'] = self.type
+        if self.value is not None:
+            result['value'] = self.value
+        return result
+
+
+class Resistance(Weakness):
+    __slots__ = ()
+
+
+class SetRef:
+    __slots__ = ('id', 'name', 'logo', 'symbol', 'card_count', 'extra')
+
+    # Cartas do mesmo set compartilham a mesma instância
+    _cache: Dict[tuple, 'SetRef'] = {}
+
+    def __init__(self, id=None, name=None, logo=None, symbol=None, card_count=None, extra=None):
+        self.id = id
+        self.name = name
+        self.logo = logo
+        self.symbol = symbol
+        self.card_count = card_count
+        self.extra = extra
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'SetRef':
+        key = tuple(
+            (k, tuple(v.items()) if isinstance(v, dict) else v) for k, v in data.items()
+        )
+        try:
+            cached = cls._cache.get(key)
+        except TypeError:
+            # Valor não hashable (formato inesperado): não compartilha a instância
+            key = None
+            cached = None
+        if cached is not None:
+            return cached
+
+        data, nulls = _split_nulls(data)
+        ref = cls(
+            id=_intern(data.pop('id', None)),
+            name=_intern(data.pop('name', None)),
+            logo=_intern(data.pop('logo', None)),
+            symbol=_intern(data.pop('symbol', None)),
+            card_count=data.pop('cardCount', None),
+            extra=_extra(data, nulls),
+        )
+        if key is not None:
+            cls._cache[key] = ref
+        return ref
+
+    def to_dict(self) -> Dict:
+        result = _base_dict(self.extra)
+        if self.card_count is not None:
+            result['cardCount'] = _copy(self.card_count)
+        if self.id is not None:
+            result['id'] = self.id
+        if self.logo is not None:
+            result['logo'] = self.logo
+        if self.name is not None:
+            result['name'] = self.name
+        if self.symbol is not None:
+            result['symbol'] = self.symbol
+        return result
+
+
+class Card:
+    """Carta detalhada. Campos ausentes ou null no JSON ficam como None; campos
+    não modelados e nulls explícitos são preservados em `extra`."""
+
+    __slots__ = (
+        'id', 'local_id', 'name', 'image', 'category', 'illustrator', 'rarity',
+        'set', 'hp', 'types', 'stage', 'evolve_from', 'retreat', 'attacks',
+        'weaknesses', 'resistances', 'updated', 'extra',
+    )
+
+    # (atributo, chave no JSON, internar?)
+    _SCALARS = (
+        ('id', 'id', False),
+        ('local_id', 'localId', False),
+        ('name', 'name', False),
+        ('image', 'image', False),
+        ('category', 'category', True),
+        ('illustrator', 'illustrator', True),
+        ('rarity', 'rarity', True),
+        ('hp', 'hp', False),
+        ('stage', 'stage', True),
+        ('evolve_from', 'evolveFrom', True),
+        ('retreat', 'retreat', False),
+        ('updated', 'updated', False),
+    )
+
+    def __init__(self, **fields):
+        for attr in self.__slots__:
+            setattr(self, attr, fields.get(attr))
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'Card':
+        data, nulls = _split_nulls(data)
+        card = cls()
+
+        for attr, key, intern in cls._SCALARS:
+            value = data.pop(key, None)
+            setattr(card, attr, _intern(value) if intern else value)
+
+        card_set = data.pop('set', None)
+        card.set = SetRef.from_dict(card_set) if isinstance(card_set, dict) else card_set
+        card.types = _intern_list(data.pop('types', None))
+
+        attacks = data.pop('attacks', None)
+        card.attacks = _from_list(Attack, attacks)
+        card.weaknesses = _from_list(Weakness, data.pop('weaknesses', None))
+        card.resistances = _from_list(Resistance, data.pop('resistances', None))
+
+        card.extra = _extra(data, nulls)
+        return card
+
+    def to_dict(self) -> Dict[str, Any]:
+        result = _base_dict(self.extra)
+
+        for attr, key, _ in self._SCALARS:
+            value = getattr(self, attr)
+            if value is not None:
+                result[key] = value
+
+        if self.set is not None:
+            result['set'] = self.set.to_dict() if isinstance(self.set, SetRef) else self.set
+        if self.types is not None:
+            result['types'] = _copy(self.types)
+        if self.attacks is not None:
+            result['attacks'] = _to_list(self.attacks)
+        if self.weaknesses is not None:
+            result['weaknesses'] = _to_list(self.weaknesses)
+        if self.resistances is not None:
+            result['resistances'] = _to_list(self.resistances)
+
+        return result
+
+    @property
+    def set_id(self) -> Optional[str]:
+        """ID do set da carta (bw1-1 → bw1 quando não houver set)."""
+        if isinstance(self.set, SetRef) and self.set.id:
+            return self.set.id
+        return set_id_from_card_id(self.id) if self.id else None
+
+
+def cards_from_json(data: List[Dict]) -> List[Card]:
+    """Converte a lista de cartas da API para o modelo compacto."""
+    return [Card.from_dict(item) for item in data]
+
+
+def cards_to_json(cards: List[Card]) -> List[Dict]:
+    """Converte o modelo compacto de volta para o formato JSON da API."""
+    return [card.to_dict() for card in cards]
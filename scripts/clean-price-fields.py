@@ -3,10 +3,11 @@
 Script para remover campos de preço/valor do JSON das cartas Pokémon
 """
 
-import json
 import os
 from pathlib import Path
 
+import json_codec
+
 def clean_price_fields():
     """Remove campos relacionados a preços do JSON."""
     
@@ -19,8 +20,7 @@ def clean_price_fields():
     print("🧹 Limpando campos de preço do JSON...")
     
     # Carrega o arquivo
-    with open(data_file, 'r', encoding='utf-8') as f:
-        cards = json.load(f)
+    cards = json_codec.load(data_file)
     
     print(f"📊 Total de cartas: {len(cards)}")
     
@@ -48,8 +48,7 @@ def clean_price_fields():
             cleaned_count += 1
     
     # Salva o arquivo limpo
-    with open(data_file, 'w', encoding='utf-8') as f:
-        json.dump(cards, f, ensure_ascii=False, indent=2)
+    json_codec.dump(cards, data_file)
     
     print(f"✅ Campos de preço removidos: {cleaned_count}")
     print(f"💾 Arquivo salvo: {data_file}")
@@ -5,21 +5,28 @@ e salvar em JSON para uso offline no app React Native.
 """
 
 import requests
-import json
+import hashlib
 import time
 import os
+from datetime import datetime, timezone
 from typing import Dict, List, Optional
 from pathlib import Path
 
+import json_codec
+from card_model import Card, card_set_id, cards_from_json, cards_to_json
+
 class PokemonCardDownloader:
     def __init__(self, data_dir: str = "ProjetoPokemon/assets/data"):
         self.base_url = "https://api.tcgdex.net/v2/pt/cards"
+        self.sets_url = "https://api.tcgdex.net/v2/pt/sets"
         self.data_dir = Path(data_dir)
         self.data_dir.mkdir(parents=True, exist_ok=True)
         
         # Arquivos
         self.cards_list_file = self.data_dir / "pokemon_list.json"
         self.detailed_cards_file = self.data_dir / "pokemon_cards_detailed.json"
+        self.sets_file = self.data_dir / "pokemon_sets.json"
+        self.fingerprints_file = self.data_dir / "set_fingerprints.json"
         
         # Controle de rate limiting
         self.request_delay = 0.5  # 500ms entre requests
@@ -29,24 +36,22 @@ class PokemonCardDownloader:
         if not self.cards_list_file.exists():
             raise FileNotFoundError(f"Arquivo {self.cards_list_file} não encontrado!")
             
-        with open(self.cards_list_file, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return json_codec.load(self.cards_list_file)
     
-    def load_existing_detailed_cards(self) -> Dict[str, Dict]:
+    def load_existing_detailed_cards(self) -> Dict[str, Card]:
         """Carrega os dados detalhados existentes."""
         if not self.detailed_cards_file.exists():
             return {}
             
         try:
-            with open(self.detailed_cards_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                # Converte lista para dict para busca mais rápida
-                return {card['id']: card for card in data}
-        except (json.JSONDecodeError, KeyError):
+            data = json_codec.load(self.detailed_cards_file)
+            # Converte lista para dict para busca mais rápida
+            return {card.id: card for card in cards_from_json(data)}
+        except (json_codec.JSONDecodeError, KeyError):
             print("⚠️  Arquivo de dados detalhados corrompido, iniciando do zero...")
             return {}
     
-    def fetch_card_details(self, card_id: str) -> Optional[Dict]:
+    def fetch_card_details(self, card_id: str) -> Optional[Card]:
         """Baixa os detalhes de uma carta específica."""
         url = f"{self.base_url}/{card_id}"
         
@@ -61,18 +66,116 @@ class PokemonCardDownloader:
                 if field in card_data:
                     del card_data[field]
             
-            return card_data
+            return Card.from_dict(card_data)
         except requests.exceptions.RequestException as e:
             print(f"❌ Erro ao baixar carta {card_id}: {e}")
             return None
     
-    def save_detailed_cards(self, cards_data: List[Dict]):
+    def fetch_sets(self) -> List[Dict]:
+        """Baixa a lista resumida de sets."""
+        response = requests.get(self.sets_url, timeout=10)
+        response.raise_for_status()
+        return response.json()
+
+    def fetch_set_details(self, set_id: str) -> Optional[Dict]:
+        """Baixa o resumo de um set, incluindo a lista breve de cartas."""
+        url = f"{self.sets_url}/{set_id}"
+
+        try:
+            response = requests.get(url, timeout=10)
+            response.raise_for_status()
+            return response.json()
+        except requests.exceptions.RequestException as e:
+            print(f"❌ Erro ao baixar set {set_id}: {e}")
+            return None
+
+    def load_fingerprints(self) -> Dict[str, Dict]:
+        """Carrega as impressões digitais salvas de cada set."""
+        if not self.fingerprints_file.exists():
+            return {}
+
+        try:
+            return json_codec.load(self.fingerprints_file)
+        except json_codec.JSONDecodeError:
+            print("⚠️  Arquivo de fingerprints corrompido, todos os sets serão verificados...")
+            return {}
+
+    def save_fingerprints(self, fingerprints: Dict[str, Dict]):
+        """Salva as impressões digitais dos sets."""
+        json_codec.dump(fingerprints, self.fingerprints_file)
+
+    @staticmethod
+    def set_fingerprint(set_data: Dict) -> Dict:
+        """Calcula a impressão digital de um set a partir da lista breve de cartas."""
+        briefs = sorted(set_data.get('cards') or [], key=lambda c: c['id'])
+        digest = hashlib.sha1(json_codec.dumps(briefs, pretty=False, as_bytes=True)).hexdigest()
+
+        return {
+            'cardCount': len(briefs),
+            'hash': digest,
+            'releaseDate': set_data.get('releaseDate') or '',
+        }
+
+    def save_cards_list(self, cards: List[Dict]):
+        """Salva a lista básica de cartas."""
+        json_codec.dump(cards, self.cards_list_file)
+        print(f"💾 Lista salva em: {self.cards_list_file} ({len(cards)} cartas)")
+
+    def sync_cards_list(self, cards_list: List[Dict], set_data: Dict) -> List[Dict]:
+        """Atualiza a lista básica com as cartas atuais de um set (novas e removidas)."""
+        set_id = set_data['id']
+        briefs = set_data.get('cards') or []
+        valid_ids = {card['id'] for card in briefs}
+
+        kept = [card for card in cards_list
+                if card_set_id(card) != set_id or card['id'] in valid_ids]
+        known_ids = {card['id'] for card in kept}
+        # Mantém o brief completo (id, localId, name, image) usado pelo app
+        kept.extend(dict(card) for card in briefs if card['id'] not in known_ids)
+        return kept
+
+    def load_sets_list(self) -> List[Dict]:
+        """Carrega o pokemon_sets.json (lista vazia se não existir)."""
+        if not self.sets_file.exists():
+            return []
+        return json_codec.load(self.sets_file)
+
+    def save_sets_list(self, sets: List[Dict]):
+        """Salva o pokemon_sets.json."""
+        json_codec.dump(sets, self.sets_file)
+        print(f"💾 Sets salvos em: {self.sets_file} ({len(sets)} sets)")
+
+    @staticmethod
+    def sync_sets_list(sets_list: List[Dict], set_data: Dict) -> List[Dict]:
+        """Insere ou atualiza um set no pokemon_sets.json a partir do resumo da API."""
+        card_count = set_data.get('cardCount') or {}
+        serie = set_data.get('serie')
+        entry = {
+            'id': set_data['id'],
+            'name': set_data.get('name'),
+            'series': serie.get('id') if isinstance(serie, dict) else serie,
+            'releaseDate': set_data.get('releaseDate'),
+            'totalCards': card_count.get('total') or card_count.get('official') or len(set_data.get('cards') or []),
+            'symbol': set_data.get('symbol'),
+            'logo': set_data.get('logo'),
+        }
+
+        for i, item in enumerate(sets_list):
+            if item['id'] == entry['id']:
+                # Campos que a API não devolveu continuam com o valor atual
+                sets_list[i] = {**item, **{k: v for k, v in entry.items() if v is not None}}
+                return sets_list
+
+        # Set novo: campos ausentes seguem o formato do arquivo ('' em vez de null)
+        sets_list.append({k: '' if v is None else v for k, v in entry.items()})
+        return sets_list
+
+    def save_detailed_cards(self, cards_data: List[Card]):
         """Salva os dados detalhados em arquivo JSON."""
         # Ordena por ID para consistência
-        cards_data.sort(key=lambda x: x['id'])
+        cards_data.sort(key=lambda x: x.id)
         
-        with open(self.detailed_cards_file, 'w', encoding='utf-8') as f:
-            json.dump(cards_data, f, ensure_ascii=False, indent=2)
+        json_codec.dump(cards_to_json(cards_data), self.detailed_cards_file)
         
         print(f"💾 Dados salvos em: {self.detailed_cards_file}")
         print(f"📊 Total de cartas salvas: {len(cards_data)}")
@@ -145,6 +248,125 @@ class PokemonCardDownloader:
             print(f"\n⚠️  {error_count} cartas falharam no download.")
             print("   Execute novamente para tentar baixar as que falharam.")
 
+    def refresh_changed_sets(self):
+        """Verifica os resumos dos sets e baixa novamente só os sets alterados.
+
+        pokemon_sets.json e pokemon_list.json são atualizados no mesmo ciclo
+        a partir dos resumos dos sets alterados.
+        """
+        print("🔍 Verificando sets alterados...")
+
+        fingerprints = self.load_fingerprints()
+        existing_detailed = self.load_existing_detailed_cards()
+        cards_list = self.load_existing_cards() if self.cards_list_file.exists() else []
+        sets_list = self.load_sets_list()
+        now = datetime.now(timezone.utc).isoformat()
+
+        try:
+            sets = self.fetch_sets()
+        except requests.exceptions.RequestException as e:
+            print(f"❌ Erro ao baixar lista de sets: {e}")
+            return
+
+        # Sets nunca vistos primeiro, depois os mais recentes da lista da API
+        sets = list(reversed(sets))
+        sets.sort(key=lambda s: s['id'] in fingerprints)
+
+        changed_sets = []
+        for i, set_brief in enumerate(sets, 1):
+            set_id = set_brief['id']
+            print(f"[{i}/{len(sets)}] Verificando {set_id}...", end=' ')
+
+            set_data = self.fetch_set_details(set_id)
+            time.sleep(self.request_delay)
+            if not set_data:
+                print("❌")
+                continue
+
+            fingerprint = self.set_fingerprint(set_data)
+            previous = fingerprints.get(set_id)
+
+            if previous and previous['hash'] == fingerprint['hash']:
+                previous['lastSeen'] = now
+                print("✅")
+            else:
+                changed_sets.append((set_data, fingerprint, previous is None))
+                print("🆕" if previous is None else "🔄")
+
+        print(f"🔄 Sets alterados: {len(changed_sets)}/{len(sets)}")
+
+        if not changed_sets:
+            self.save_fingerprints(fingerprints)
+            print("✅ Todas as cartas já estão atualizadas!")
+            return
+
+        # Sets novos primeiro, depois por data de lançamento mais recente
+        changed_sets.sort(key=lambda item: item[1]['releaseDate'], reverse=True)
+        changed_sets.sort(key=lambda item: not item[2])
+
+        success_count = 0
+        error_count = 0
+
+        for set_data, fingerprint, _ in changed_sets:
+            set_id = set_data['id']
+            card_ids = [card['id'] for card in set_data.get('cards') or []]
+            print(f"\n📦 Atualizando {set_id} ({len(card_ids)} cartas)...")
+
+            set_errors = 0
+            for card_id in card_ids:
+                detailed_data = self.fetch_card_details(card_id)
+
+                if detailed_data:
+                    existing_detailed[card_id] = detailed_data
+                    success_count += 1
+                else:
+                    set_errors += 1
+
+                # Rate limiting
+                time.sleep(self.request_delay)
+
+            # A lista básica acompanha o set mesmo se alguma carta falhar
+            cards_list = self.sync_cards_list(cards_list, set_data)
+            sets_list = self.sync_sets_list(sets_list, set_data)
+
+            # Remove cartas que saíram do set
+            valid_ids = set(card_ids)
+            for card_id in [cid for cid, card in existing_detailed.items()
+                            if card.set_id == set_id and cid not in valid_ids]:
+                del existing_detailed[card_id]
+
+            error_count += set_errors
+            if set_errors:
+                # Mantém a fingerprint antiga para tentar de novo no próximo ciclo
+                print(f"⚠️  {set_errors} cartas de {set_id} falharam no download.")
+            else:
+                fingerprints[set_id] = {**fingerprint, 'lastSeen': now}
+
+        self.save_sets_list(sets_list)
+        self.save_cards_list(cards_list)
+        self.save_detailed_cards(list(existing_detailed.values()))
+        self.save_fingerprints(fingerprints)
+
+        # Relatório final
+        print("\n" + "="*50)
+        print("📊 RELATÓRIO DA ATUALIZAÇÃO:")
+        print(f"📦 Sets atualizados: {len(changed_sets)}")
+        print(f"✅ Sucessos: {success_count}")
+        print(f"❌ Erros: {error_count}")
+
+    def run_refresh_daemon(self, interval: int):
+        """Executa a verificação de sets continuamente a cada intervalo."""
+        print(f"⏰ Modo daemon: verificando sets a cada {interval}s")
+
+        while True:
+            try:
+                self.refresh_changed_sets()
+            except Exception as e:
+                # Um ciclo com erro não derruba o daemon; tenta de novo no próximo
+                print(f"❌ Erro no ciclo de atualização: {e}")
+            print(f"😴 Próxima verificação em {interval}s...")
+            time.sleep(interval)
+
 def main():
     """Função principal."""
     import argparse
@@ -155,6 +377,17 @@ def main():
         action='store_true', 
         help='Modo atualização: baixa apenas cartas novas'
     )
+    parser.add_argument(
+        '--refresh',
+        action='store_true',
+        help='Verifica os sets e baixa novamente só os que mudaram (ideal para cron)'
+    )
+    parser.add_argument(
+        '--daemon',
+        type=int,
+        metavar='SEGUNDOS',
+        help='Repete o modo --refresh continuamente no intervalo informado'
+    )
     parser.add_argument(
         '--data-dir', 
         default='ProjetoPokemon/assets/data',
@@ -162,10 +395,17 @@ def main():
     )
     
     args = parser.parse_args()
+    if args.daemon is not None and args.daemon <= 0:
+        parser.error("--daemon precisa de um intervalo maior que zero")
     
     try:
         downloader = PokemonCardDownloader(args.data_dir)
-        downloader.download_all_cards(update_only=args.update)
+        if args.daemon is not None:
+            downloader.run_refresh_daemon(args.daemon)
+        elif args.refresh:
+            downloader.refresh_changed_sets()
+        else:
+            downloader.download_all_cards(update_only=args.update)
     except FileNotFoundError as e:
         print(f"❌ Erro: {e}")
         print("   Certifique-se de que o arquivo pokemon_list.json existe!")
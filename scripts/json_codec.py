@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Camada única de leitura/escrita de JSON usada pelos scripts Python.
+Usa orjson quando estiver instalado e cai para o json da stdlib caso contrário.
+A saída é sempre determinística (chaves ordenadas, UTF-8 sem escapes) para
+manter os diffs do git pequenos.
+
+Os dois backends geram os mesmos bytes para os dados do projeto (chaves
+string, inteiros, floats comuns). Diferenças conhecidas:
+- floats em notação exponencial: orjson escreve 1e16, a stdlib 1e+16;
+- dicts só com chaves int: orjson ordena como string ("10" antes de "2"),
+  a stdlib ordena pelo valor numérico.
+Chaves não-string de tipos misturados são convertidas para string nos dois.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - backend opcional
+    orjson = None
+
+# Permite forçar a stdlib (ex.: POKEMON_JSON_BACKEND=json) para comparar saídas
+BACKEND = 'orjson' if orjson is not None and os.environ.get('POKEMON_JSON_BACKEND') != 'json' else 'json'
+
+# orjson.JSONDecodeError é subclasse desta, então um único except cobre os dois
+JSONDecodeError = json.JSONDecodeError
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """Decodifica JSON a partir de str ou bytes."""
+    if BACKEND == 'orjson':
+        return orjson.loads(data)
+    if isinstance(data, bytes):
+        data = data.decode('utf-8')
+    return json.loads(data)
+
+
+def _stringify_keys(obj: Any) -> Any:
+    """Converte chaves não-string como o JSON faz (True → "true", 1 → "1")."""
+    if isinstance(obj, dict):
+        return {
+            (k if isinstance(k, str) else json.dumps(k)): _stringify_keys(v)
+            for k, v in obj.items()
+        }
+    if isinstance(obj, (list, tuple)):
+        return [_stringify_keys(v) for v in obj]
+    return obj
+
+
+def dumps(obj: Any, pretty: bool = True, as_bytes: bool = False) -> Union[str, bytes]:
+    """Codifica `obj` com chaves ordenadas.
+
+    pretty=True gera indentação de 2 espaços (um campo por linha);
+    pretty=False gera a forma compacta, sem espaços.
+    """
+    if BACKEND == 'orjson':
+        option = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        data = orjson.dumps(obj, option=option)
+        return data if as_bytes else data.decode('utf-8')
+
+    if pretty:
+        options = {'indent': 2}
+    else:
+        options = {'separators': (',', ':')}
+    try:
+        text = json.dumps(obj, ensure_ascii=False, sort_keys=True, **options)
+    except TypeError:
+        # Chaves de tipos misturados não são comparáveis; ordena já como string
+        text = json.dumps(_stringify_keys(obj), ensure_ascii=False, sort_keys=True, **options)
+    return text.encode('utf-8') if as_bytes else text
+
+
+def load(path: Union[str, Path]) -> Any:
+    """Lê um arquivo JSON."""
+    with open(path, 'rb') as f:
+        return loads(f.read())
+
+
+def dump(obj: Any, path: Union[str, Path], pretty: bool = True):
+    """Grava `obj` em um arquivo JSON (UTF-8, com quebra de linha final)."""
+    with open(path, 'wb') as f:
+        f.write(dumps(obj, pretty=pretty, as_bytes=True))
+        f.write(b'\n')
@@ -1,108 +1,175 @@
 #!/usr/bin/env python3
 """
-Script para remover todos os dados de Mega Evolução dos 4 JSONs principais
+Script para remover todos os dados de Mega Evolução dos 4 JSONs principais.
+Primeiro descobre os sets excluídos (sets das séries excluídas, mais os já
+removidos em execuções anteriores, salvos em excluded_sets.json); depois
+filtra os dois arquivos de cartas em paralelo pelo ID do set. Os arquivos só
+são substituídos depois que todos foram gerados. Arquivos de cartas ausentes
+são ignorados.
 """
 
-import json
 import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Set, Tuple
+
+import json_codec
+from card_model import card_set_id
+
+# Séries removidas (ID da série no pokemon_series.json)
+EXCLUDED_SERIES = {'me'}
+
+SERIES_FILE = "assets/data/pokemon_series.json"
+SETS_FILE = "assets/data/pokemon_sets.json"
+# IDs de sets já excluídos, para pegar cartas que voltarem em atualizações
+EXCLUDED_SETS_FILE = "assets/data/excluded_sets.json"
+CARD_FILES = [
+    ("assets/data/pokemon_list.json", "Lista de Cartas"),
+    ("assets/data/pokemon_cards_detailed.json", "Cartas Detalhadas"),
+]
+
+
+def temp_path(file_path: str) -> str:
+    """Arquivo temporário no mesmo diretório, para que o os.replace seja atômico."""
+    return f"{file_path}.tmp"
+
+
+def filter_card_file(file_path: str, excluded_sets: Set[str],
+                     known_sets: Set[str]) -> Tuple[int, int, List[str]]:
+    """Filtra um arquivo de cartas (executado em um processo separado).
+
+    Remove as cartas dos sets excluídos e grava o resultado no arquivo
+    temporário. Cartas de sets desconhecidos (fora do pokemon_sets.json)
+    são mantidas e apenas reportadas. Retorna (removidos, restantes, sets desconhecidos).
+    """
+    cards = json_codec.load(file_path)
+    filtered = []
+    unknown_sets = set()
+    for card in cards:
+        set_id = card_set_id(card)
+        if set_id in excluded_sets:
+            continue
+        if set_id not in known_sets:
+            unknown_sets.add(set_id)
+        filtered.append(card)
+    json_codec.dump(filtered, temp_path(file_path))
+    return len(cards) - len(filtered), len(filtered), sorted(unknown_sets)
+
+
+def commit_outputs(file_paths: List[str]) -> bool:
+    """Substitui os originais pelos temporários, na ordem dada.
+
+    Cada os.replace é atômico, mas o grupo não: se um falhar, os arquivos
+    anteriores já foram substituídos. Nesse caso os temporários restantes
+    são removidos, o que já foi gravado é reportado e retorna False.
+    """
+    committed = []
+    for file_path in file_paths:
+        try:
+            os.replace(temp_path(file_path), file_path)
+        except OSError as e:
+            print(f"❌ Erro ao substituir {file_path}: {e}")
+            discard_outputs(file_paths)
+            print(f"⚠️ Já substituídos: {', '.join(committed) or 'nenhum'}")
+            print(f"⚠️ Não alterados: {', '.join(p for p in file_paths if p not in committed)}")
+            return False
+        committed.append(file_path)
+    return True
+
+
+def discard_outputs(file_paths: List[str]):
+    """Remove os temporários quando algum arquivo falhou."""
+    for file_path in file_paths:
+        if os.path.exists(temp_path(file_path)):
+            os.remove(temp_path(file_path))
+
+
+def load_exclusions(excluded_series: Set[str]) -> Optional[Tuple[List[Dict], List[Dict], Set[str]]]:
+    """Filtra séries e sets; retorna (séries restantes, sets restantes, sets excluídos).
+
+    Os sets excluídos incluem os salvos em execuções anteriores, que já não
+    aparecem no pokemon_sets.json.
+    """
+    for file_path in (SERIES_FILE, SETS_FILE):
+        if not os.path.exists(file_path):
+            print(f"❌ Arquivo não encontrado: {file_path}")
+            return None
+
+    series = json_codec.load(SERIES_FILE)
+    sets = json_codec.load(SETS_FILE)
+
+    filtered_series = [item for item in series if item['id'] not in excluded_series]
+    new_excluded = {item['id'] for item in sets if item.get('series') in excluded_series}
+    filtered_sets = [item for item in sets if item['id'] not in new_excluded]
+
+    previous_excluded = set()
+    if os.path.exists(EXCLUDED_SETS_FILE):
+        previous_excluded = set(json_codec.load(EXCLUDED_SETS_FILE))
+    excluded_sets = new_excluded | previous_excluded
+
+    print(f"\n🔍 Séries: {len(series) - len(filtered_series)} removidas, {len(filtered_series)} restantes")
+    print(f"🔍 Sets: {len(new_excluded)} removidos, {len(filtered_sets)} restantes")
+    if excluded_sets:
+        print(f"   - Sets excluídos (incluindo execuções anteriores): {', '.join(sorted(excluded_sets))}")
+
+    return filtered_series, filtered_sets, excluded_sets
 
-def remove_mega_evolution_from_json(file_path, description):
-    """Remove todos os dados relacionados à Mega Evolução de um JSON"""
-    print(f"\n🔍 Processando {description}...")
-    
-    if not os.path.exists(file_path):
-        print(f"❌ Arquivo não encontrado: {file_path}")
-        return False
-    
-    try:
-        # Ler o arquivo
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        original_count = len(data)
-        print(f"📊 Total original: {original_count}")
-        
-        # Filtrar dados que NÃO são de Mega Evolução
-        filtered_data = []
-        removed_count = 0
-        
-        for item in data:
-            # Verificar se é relacionado à Mega Evolução
-            is_mega_evolution = False
-            
-            # Verificar ID
-            if 'id' in item:
-                item_id = item['id']
-                if item_id.startswith('me'):
-                    is_mega_evolution = True
-                elif 'mega' in item_id.lower() or 'megaevolução' in item_id.lower():
-                    is_mega_evolution = True
-            
-            # Verificar nome
-            if 'name' in item:
-                item_name = item['name'].lower()
-                if 'mega' in item_name or 'megaevolução' in item_name:
-                    is_mega_evolution = True
-            
-            # Verificar série
-            if 'series' in item:
-                if item['series'] == 'me':
-                    is_mega_evolution = True
-            
-            # Verificar set
-            if 'set' in item:
-                if isinstance(item['set'], dict) and 'id' in item['set']:
-                    if item['set']['id'].startswith('me'):
-                        is_mega_evolution = True
-                elif isinstance(item['set'], str) and item['set'].startswith('me'):
-                    is_mega_evolution = True
-            
-            if not is_mega_evolution:
-                filtered_data.append(item)
-            else:
-                removed_count += 1
-        
-        # Salvar arquivo filtrado
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(filtered_data, f, ensure_ascii=False, indent=2)
-        
-        print(f"✅ {description} processado:")
-        print(f"   - Removidos: {removed_count}")
-        print(f"   - Restantes: {len(filtered_data)}")
-        
-        return True
-        
-    except Exception as e:
-        print(f"❌ Erro ao processar {file_path}: {e}")
-        return False
 
 def main():
     print("🚀 Removendo todos os dados de Mega Evolução dos JSONs...")
-    
-    # Definir arquivos e descrições
-    files_to_process = [
-        ("assets/data/pokemon_series.json", "Séries"),
-        ("assets/data/pokemon_sets.json", "Sets"),
-        ("assets/data/pokemon_list.json", "Lista de Cartas"),
-        ("assets/data/pokemon_cards_detailed.json", "Cartas Detalhadas")
-    ]
-    
-    success_count = 0
-    
-    for file_path, description in files_to_process:
-        if remove_mega_evolution_from_json(file_path, description):
-            success_count += 1
-    
-    print(f"\n📊 Resumo:")
-    print(f"✅ Arquivos processados com sucesso: {success_count}/{len(files_to_process)}")
-    
-    if success_count == len(files_to_process):
-        print("🎉 Todos os dados de Mega Evolução foram removidos!")
-        print("🚀 Agora você pode testar o script atualizado!")
-    else:
-        print("⚠️ Alguns arquivos não foram processados corretamente.")
+
+    exclusions = load_exclusions(EXCLUDED_SERIES)
+    if exclusions is None:
+        sys.exit(1)
+    filtered_series, filtered_sets, excluded_sets = exclusions
+    known_sets = {item['id'] for item in filtered_sets}
+
+    card_files = [(path, desc) for path, desc in CARD_FILES if os.path.exists(path)]
+    skipped = [path for path, _ in CARD_FILES if not os.path.exists(path)]
+    for path in skipped:
+        print(f"⏭️  Arquivo não encontrado, ignorado: {path}")
+
+    written = []
+    try:
+        # Gravado primeiro: mesmo que outro arquivo falhe depois, a exclusão fica registrada
+        json_codec.dump(sorted(excluded_sets), temp_path(EXCLUDED_SETS_FILE))
+        written.append(EXCLUDED_SETS_FILE)
+        json_codec.dump(filtered_series, temp_path(SERIES_FILE))
+        written.append(SERIES_FILE)
+        json_codec.dump(filtered_sets, temp_path(SETS_FILE))
+        written.append(SETS_FILE)
+
+        # Cada arquivo de cartas é filtrado em um processo próprio
+        with ProcessPoolExecutor(max_workers=max(len(card_files), 1)) as executor:
+            futures = [
+                (path, desc, executor.submit(filter_card_file, path, excluded_sets, known_sets))
+                for path, desc in card_files
+            ]
+            for path, desc, future in futures:
+                removed_count, remaining_count, unknown_sets = future.result()
+                written.append(path)
+                print(f"✅ {desc} filtrado:")
+                print(f"   - Removidos: {removed_count}")
+                print(f"   - Restantes: {remaining_count}")
+                if unknown_sets:
+                    print(f"   - ⚠️ Sets fora do pokemon_sets.json (mantidos): {', '.join(unknown_sets)}")
+
+    except Exception as e:
+        print(f"❌ Erro ao processar os arquivos: {e}")
+        discard_outputs(written + [path for path, _ in CARD_FILES])
+        print("⚠️ Nenhum arquivo foi alterado.")
         sys.exit(1)
 
+    if not commit_outputs(written):
+        sys.exit(1)
+
+    print(f"\n📊 Resumo:")
+    print(f"✅ Arquivos gravados: {', '.join(written)}")
+    if skipped:
+        print(f"⏭️  Arquivos ignorados (não encontrados): {len(skipped)}")
+    print("🎉 Todos os dados de Mega Evolução foram removidos!")
+    print("🚀 Agora você pode testar o script atualizado!")
+
+
 if __name__ == "__main__":
     main()
@@ -4,10 +4,11 @@ Script para remover cards de Megaevolução do pokemon_cards_detailed.json
 Remove todos os cards que começam com "me01"
 """
 
-import json
 import os
 from pathlib import Path
 
+import json_codec
+
 def remove_megaevolution_cards():
     """Remove cards de Megaevolução do arquivo detalhado."""
     
@@ -20,8 +21,7 @@ def remove_megaevolution_cards():
     print("🧹 Removendo cards de Megaevolução...")
     
     # Carrega o arquivo
-    with open(data_file, 'r', encoding='utf-8') as f:
-        cards = json.load(f)
+    cards = json_codec.load(data_file)
     
     print(f"📊 Total de cartas antes: {len(cards)}")
     
@@ -40,8 +40,7 @@ def remove_megaevolution_cards():
     print(f"📊 Total de cartas depois: {len(filtered_cards)}")
     
     # Salva o arquivo filtrado
-    with open(data_file, 'w', encoding='utf-8') as f:
-        json.dump(filtered_cards, f, ensure_ascii=False, indent=2)
+    json_codec.dump(filtered_cards, data_file)
     
     print(f"💾 Arquivo atualizado: {data_file}")
     print("✅ Cards de Megaevolução removidos com sucesso!")
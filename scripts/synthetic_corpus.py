@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Corpus sintético de cartas no formato da API tcgdex, usado pelos benchmarks
+quando o pokemon_cards_detailed.json real não está disponível.
+"""
+
+import random
+
+import json_codec
+
+LANGUAGES = ['pt', 'en', 'es', 'fr', 'de', 'it']
+RARITIES = ['Comum', 'Incomum', 'Rara', 'Rara Holo', 'Rara Dupla', 'Ultra Rara']
+TYPES = ['Fogo', 'Água', 'Planta', 'Elétrico', 'Psíquico', 'Lutador', 'Escuridão', 'Metal', 'Dragão', 'Incolor']
+STAGES = ['Básico', 'Estágio 1', 'Estágio 2']
+
+
+def synthetic_corpus(total: int, sets: int = 170) -> str:
+    """Gera um corpus de cartas no formato da API tcgdex, serializado em JSON."""
+    rng = random.Random(42)
+    cards = []
+    per_set = max(total // (sets * len(LANGUAGES)), 1)
+
+    for lang in LANGUAGES:
+        for s in range(sets):
+            set_id = f"set{s}"
+            set_ref = {
+                'cardCount': {'official': per_set, 'total': per_set},
+                'id': set_id,
+                'logo': f"https://assets.tcgdex.net/{lang}/{set_id}/logo",
+                'name': f"Set {s} ({lang})",
+                'symbol': f"https://assets.tcgdex.net/univ/{set_id}/symbol",
+            }
+            for n in range(1, per_set + 1):
+                if len(cards) >= total:
+                    break
+                card_type = rng.choice(TYPES)
+                cards.append({
+                    'id': f"{set_id}-{n}",
+                    'localId': str(n),
+                    'name': f"Pokémon {rng.randint(1, 1000)}",
+                    'image': f"https://assets.tcgdex.net/{lang}/{set_id}/{n}",
+                    'category': 'Pokemon',
+                    'illustrator': f"Ilustrador {rng.randint(1, 300)}",
+                    'rarity': rng.choice(RARITIES),
+                    'set': set_ref,
+                    'hp': rng.choice([60, 70, 90, 120, 220]),
+                    'types': [card_type],
+                    'stage': rng.choice(STAGES),
+                    'attacks': [{
+                        'cost': [card_type, 'Incolor'],
+                        'name': f"Ataque {rng.randint(1, 500)}",
+                        'damage': rng.choice([10, 30, 60, '120+']),
+                    }],
+                    'weaknesses': [{'type': rng.choice(TYPES), 'value': '×2'}],
+                    'retreat': rng.randint(0, 3),
+                    'variants': {'firstEdition': False, 'holo': True, 'normal': True, 'reverse': True},
+                    'legal': {'standard': False, 'expanded': True},
+                })
+
+    return json_codec.dumps(cards, pretty=False)
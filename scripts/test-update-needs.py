@@ -3,9 +3,10 @@
 Script para testar quantas cartas realmente precisam de atualização
 """
 
-import json
 from pathlib import Path
 
+import json_codec
+
 def test_cards_needing_update():
     """Testa quantas cartas precisam de atualização."""
     
@@ -18,8 +19,7 @@ def test_cards_needing_update():
     print("🧪 Testando quantas cartas precisam de atualização...")
     
     # Carrega o arquivo
-    with open(data_file, 'r', encoding='utf-8') as f:
-        cards = json.load(f)
+    cards = json_codec.load(data_file)
     
     print(f"📊 Total de cartas: {len(cards)}")
     